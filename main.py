@@ -4,12 +4,19 @@ from dataclasses import dataclass
 from typing import List
 from typing import Tuple
 import copy
+import math
 import random
 import pygame.gfxdraw
 from abc import ABC, abstractmethod
 import json
 import uuid
 import matplotlib.pyplot as plt
+import numpy as np
+from numba import njit, prange
+
+ALIVE_COLOR = (70, 70, 70)
+DEAD_COLOR = (255, 255, 255)
+BACKGROUND_COLOR = (30, 30, 30)
 
 class CellDirection(Enum):
     UPWARDS = -1
@@ -17,54 +24,73 @@ class CellDirection(Enum):
 
 class Rule(ABC):
     @abstractmethod
-    def get_new_state(self, automaton, cell) -> bool:
+    def get_lut(self, neighborhood_size: int) -> Tuple[np.ndarray, np.ndarray]:
+        # returns (weights, lut) for cells with neighborhood_size neighbors, the new state of a cell is 
+        # lut[weights[0] * its state + weights[1] * state of its first neighbor + weights[2] * ...]
         pass
 
-def line_equation(x: float, point1: pygame.Vector2, point2: pygame.Vector2):
-        return (x - point1.x) * (point2.y - point1.y) / (point2.x - point1.x) + point1.y
+@njit(cache=True, parallel=True)
+def step_cells(alive: np.ndarray, out: np.ndarray, neighbors: np.ndarray, weights: np.ndarray, lut: np.ndarray):
+    # alive and out are flattened grids, neighbors holds flat indices
+    # returns the alive and changed cell counts of the new grid, so step never rereads it
+    cell_count, neighborhood_size = neighbors.shape
+    alive_count = 0
+    changed_count = 0
+    for cell in prange(cell_count):
+        index = weights[0] * alive[cell]
+        for k in range(neighborhood_size):
+            index += weights[k + 1] * alive[neighbors[cell, k]]
+        state = lut[index]
+        out[cell] = state
+        alive_count += state
+        if state != alive[cell]:
+            changed_count += 1
+    return alive_count, changed_count
 
 class Cell:
+    # antialiased outlines double the drawing cost and barely show on small triangles, so they are opt-in
+    antialiasing = False
+    
     def __init__(self,
-                 pos: pygame.Vector2,
-                neighbors: list,
+                 pos: Tuple[float, float],
                  dir: CellDirection = CellDirection.UPWARDS,
-                 size : pygame.Vector2 = pygame.Vector2(10, 10)):
+                 size : Tuple[float, float] = (10, 10)):
         self.pos = pos
-        self.is_alive = False
         self.dir = dir
         self.size = size
-        self.neighbors = neighbors
-        self.points = [ pygame.Vector2(self.pos.x + self.size.x / 2, self.pos.y - self.dir.value * self.size.y / 2), 
-                        pygame.Vector2(self.pos.x - self.size.x / 2, self.pos.y - self.dir.value * self.size.y / 2),
-                        pygame.Vector2(self.pos.x, self.pos.y + self.dir.value * self.size.y / 2)]
+        x, y = pos
+        half_width = size[0] / 2
+        half_height = dir.value * size[1] / 2
+        self.points = ((x + half_width, y - half_height), 
+                       (x - half_width, y - half_height),
+                       (x, y + half_height))
+        # the corners never move, round them once for gfxdraw
+        self.trigon = (int(x + half_width), int(y - half_height),
+                       int(x - half_width), int(y - half_height),
+                       int(x), int(y + half_height))
+        # each side as a*x + b*y + c, positive on the inner side, so collidepoint needs no divisions
+        d = dir.value
+        (x0, y0), (x1, y1), (x2, y2) = self.points
+        slope1 = (y2 - y1) / (x2 - x1)
+        slope2 = (y0 - y2) / (x0 - x2)
+        self.edges = ((0.0, d, -d * y0),
+                      (d * slope1, -d, d * (y1 - slope1 * x1)),
+                      (d * slope2, -d, d * (y2 - slope2 * x2)))
         
-    def  draw(self, surface): 
-        pygame.gfxdraw.filled_trigon(surface, 
-                                    int(self.points[0].x), int(self.points[0].y), 
-                                    int(self.points[1].x), int(self.points[1].y),  
-                                    int(self.points[2].x), int(self.points[2].y), 
-                                    (70, 70, 70) if self.is_alive else (255, 255, 255))
-        return pygame.gfxdraw.aatrigon(surface, 
-                                    int(self.points[0].x), int(self.points[0].y), 
-                                    int(self.points[1].x), int(self.points[1].y),  
-                                    int(self.points[2].x), int(self.points[2].y), 
-                                    (70, 70, 70) if self.is_alive else (255, 255, 255))
-    
-    def collidepoint(self, point: pygame.Vector2):
-        lines = [(self.points[0], self.points[1]), (self.points[1], self.points[2]), (self.points[2], self.points[0])]
-        return  point.y * self.dir.value > line_equation(point.x, *lines[0]) * self.dir.value and\
-                point.y * self.dir.value < line_equation(point.x, *lines[1]) * self.dir.value and\
-                point.y * self.dir.value < line_equation(point.x, *lines[2]) * self.dir.value
-    
-    def __str__(self):
-        return str(int(self.is_alive))
+    def  draw(self, surface, is_alive: bool): 
+        pygame.gfxdraw.filled_trigon(surface, *self.trigon, ALIVE_COLOR if is_alive else DEAD_COLOR)
+        if Cell.antialiasing:
+            pygame.gfxdraw.aatrigon(surface, *self.trigon, ALIVE_COLOR if is_alive else DEAD_COLOR)
     
-    def __eq__(self, other):
-        if type(other) is Cell:
-            return self.is_alive == other.is_alive
-        return self.is_alive == other
+    def collidepoint(self, point: Tuple[float, float]):
+        x, y = point
+        (a0, b0, c0), (a1, b1, c1), (a2, b2, c2) = self.edges
+        return (a0 * x + b0 * y + c0 > 0) & (a1 * x + b1 * y + c1 > 0) & (a2 * x + b2 * y + c2 > 0)
 
 class Automaton:
+    # grids with every cell drawn dead by layout, see get_dead_surface
+    dead_surfaces = {}
+    
     def __init__(   self,
                     neighborhood: List[Tuple[int]],
                     rule: Rule,
@@ -86,23 +112,92 @@ class Automaton:
         self.neighborhood = neighborhood
         self.turn = 0
         self.rule = rule
+        self.weights, self.lut = rule.get_lut(len(neighborhood))
         self.cells: List[List[Cell]] = []
+        # cell states live in a single (cell_count_x, cell_count_y) array, cells only hold geometry
+        self.alive = np.zeros((cell_count_x, cell_count_y), dtype=np.uint8)
         self.cell_count_x = cell_count_x
         self.cell_count_y = cell_count_y
+        self.offset_x = offset_x
+        self.offset_y = offset_y
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+        self.cell_padding_left = cell_padding_left
+        self.cell_padding_top = cell_padding_top
         self.alive_count = 0
+        # whether the last step left the grid unchanged
+        self.stable = False
+        
+        # neighbor k of cell (i, j) is alive.ravel()[neighbors[i * cell_count_y + j, k]],
+        # upwards cells (even i + j) look at j + dj and downwards cells at j - dj
+        offsets = np.array(neighborhood, dtype=np.int32).reshape(-1, 2)
+        i = np.arange(cell_count_x, dtype=np.int32)[:, None, None]
+        j = np.arange(cell_count_y, dtype=np.int32)[None, :, None]
+        dir = np.where((i + j) % 2 == 0, 1, -1)
+        neighbors = ((i + offsets[:, 0]) % cell_count_x) * cell_count_y + (j + dir * offsets[:, 1]) % cell_count_y
+        self.neighbors = np.ascontiguousarray(neighbors.reshape(cell_count_x * cell_count_y, len(offsets)), dtype=np.int32)
         
         for i in range(cell_count_x):
             col = []
             for j in range(cell_count_y):
                 dir = CellDirection.UPWARDS if (i + j) % 2 == 0 else CellDirection.DOWNWARDS
-                neighbors = [((i + neighbor[0]) % cell_count_x, (j + (-dir.value) * neighbor[1]) % cell_count_y) for neighbor in self.neighborhood]
-                cell = Cell(pygame.Vector2(i * (cell_width / 2 + cell_padding_left) + offset_x,
-                                           j * (cell_height + cell_padding_top) + offset_y), 
-                            neighbors,
+                cell = Cell((i * (cell_width / 2 + cell_padding_left) + offset_x,
+                             j * (cell_height + cell_padding_top) + offset_y), 
                             dir,
-                            pygame.Vector2(cell_width, cell_height))
+                            (cell_width, cell_height))
                 col.append(cell)
             self.cells.append(col)
+        
+        # the k-th entry belongs to the k-th element of alive.ravel()
+        self.trigons = [cell.trigon for col in self.cells for cell in col]
+        # bounding rects including the antialiased edges, and for every cell the cells whose rects intersect its own
+        # in drawing order. Cells further apart than a rect (the triangle, the -1/+2 margin and a pixel of rounding)
+        # along the column or row pitch can't reach it
+        corners = np.array(self.trigons).reshape(-1, 3, 2)
+        lefts, tops = (corners.min(axis=1) - 1).T
+        rights, bottoms = (corners.max(axis=1) + 2).T
+        self.rects = [pygame.Rect(left, top, right - left, bottom - top) for left, top, right, bottom in zip(lefts.tolist(), tops.tolist(), rights.tolist(), bottoms.tolist())]
+        i, j = (index.ravel() for index in np.indices((cell_count_x, cell_count_y)))
+        pitch_x = cell_width / 2 + cell_padding_left
+        pitch_y = cell_height + cell_padding_top
+        reach_x = min(math.ceil((cell_width + 4) / pitch_x) if pitch_x > 0 else cell_count_x, cell_count_x - 1)
+        reach_y = min(math.ceil((cell_height + 4) / pitch_y) if pitch_y > 0 else cell_count_y, cell_count_y - 1)
+        candidates = []
+        for di in range(-reach_x, reach_x + 1):
+            for dj in range(-reach_y, reach_y + 1):
+                other = (i + di) * cell_count_y + j + dj
+                inside = (i + di >= 0) & (i + di < cell_count_x) & (j + dj >= 0) & (j + dj < cell_count_y)
+                other = np.where(inside, other, 0)
+                overlaps = inside & (lefts < rights[other]) & (lefts[other] < rights) & (tops < bottoms[other]) & (tops[other] < bottoms)
+                candidates.append(np.where(overlaps, other, -1))
+        self.overlapping = [[k for k in row if k >= 0] for row in np.stack(candidates, axis=1).tolist()]
+        self.scratch = None
+        # the grid stays drawn on its own surface, surface_state holds the states currently on it (2 is never
+        # a cell state, so the first render draws everything). Automatons returned by step() share both
+        self.surface = pygame.Surface((max(rect.right for rect in self.rects), max(rect.bottom for rect in self.rects)))
+        self.surface.fill(BACKGROUND_COLOR)
+        self.surface_state = np.full_like(self.alive, 2)
+        self.layout = (cell_count_x, cell_count_y, offset_x, offset_y, cell_width, cell_height, cell_padding_left, cell_padding_top)
+
+    def get_dead_surface(self):
+        # the grid with every cell drawn dead (without outlines), or None when some filled triangles share pixels
+        # and the drawing order matters. Painting each cell in its own color forwards and backwards gives the same
+        # picture exactly when the order doesn't matter. It only depends on the layout, so restarts reuse it
+        if self.layout not in Automaton.dead_surfaces:
+            forwards = pygame.Surface(self.surface.get_size())
+            backwards = pygame.Surface(self.surface.get_size())
+            for k, trigon in enumerate(self.trigons):
+                pygame.gfxdraw.filled_trigon(forwards, *trigon, ((k + 1) >> 16 & 255, (k + 1) >> 8 & 255, (k + 1) & 255))
+            for k, trigon in reversed(list(enumerate(self.trigons))):
+                pygame.gfxdraw.filled_trigon(backwards, *trigon, ((k + 1) >> 16 & 255, (k + 1) >> 8 & 255, (k + 1) & 255))
+            dead_surface = None
+            if pygame.image.tobytes(forwards, 'RGB') == pygame.image.tobytes(backwards, 'RGB'):
+                dead_surface = pygame.Surface(self.surface.get_size())
+                dead_surface.fill(BACKGROUND_COLOR)
+                for trigon in self.trigons:
+                    pygame.gfxdraw.filled_trigon(dead_surface, *trigon, DEAD_COLOR)
+            Automaton.dead_surfaces[self.layout] = dead_surface
+        return Automaton.dead_surfaces[self.layout]
 
     def toJSON(self):
         return json.dumps(
@@ -111,76 +206,132 @@ class Automaton:
             sort_keys=True,
             indent=4)
     
-    def gen_neighbors(self, cell: Cell):
-        return (self.cells[i][j] for i, j in cell.neighbors)
-
-    def shallow_copy_with_cells(self):
-       automaton = copy.copy(self) 
-       automaton.cells = [[copy.copy(cell) for cell in col] for col in self.cells]
-       return automaton
+    def get_neighbor_states(self, i: int, j: int):
+        return self.alive.ravel()[self.neighbors[i * self.cell_count_y + j]]
 
     def step(self):
-        automaton = self.shallow_copy_with_cells()
-        automaton.alive_count = 0
-        for i in range(len(self.cells)):
-            for j in range(len(self.cells[0])):
-                automaton.cells[i][j].is_alive = self.rule.get_new_state(self, self.cells[i][j])
-                automaton.alive_count += automaton.cells[i][j].is_alive
-        
+        automaton = copy.copy(self)
+        automaton.alive = np.empty_like(self.alive)
+        alive_count, changed_count = step_cells(self.alive.ravel(), automaton.alive.ravel(), self.neighbors, self.weights, self.lut)
+        automaton.alive_count = int(alive_count)
+        automaton.stable = changed_count == 0
         automaton.turn += 1
         return automaton
     
-    def draw(self, surface):
-        for col in self.cells:
-            for cell in col:
-                cell.draw(surface)
+    def draw_cells(self, surface, cells):
+        states = self.alive.ravel()
+        colors = (DEAD_COLOR, ALIVE_COLOR)
+        filled_trigon = pygame.gfxdraw.filled_trigon
+        aatrigon = pygame.gfxdraw.aatrigon
+        antialiasing = Cell.antialiasing
+        # lock once for the whole batch instead of once per gfxdraw call
+        surface.lock()
+        try:
+            for k in cells:
+                x0, y0, x1, y1, x2, y2 = self.trigons[k]
+                color = colors[states[k]]
+                filled_trigon(surface, x0, y0, x1, y1, x2, y2, color)
+                if antialiasing:
+                    aatrigon(surface, x0, y0, x1, y1, x2, y2, color)
+        finally:
+            surface.unlock()
+    
+    def draw(self, surface, drawn: np.ndarray | None = None):
+        if drawn is None:
+            self.draw_cells(surface, range(len(self.trigons)))
+            return
+        
+        # drawn holds the states currently on the surface, only the cells that differ from it get redrawn.
+        # Antialiased edges blend with whatever is below them (and come out differently when clipped), so every
+        # changed cell is repainted on a scratch surface from the background up, together with the cells
+        # overlapping its rect, and only its rect is copied over
+        changed = np.flatnonzero(self.alive.ravel() != drawn.ravel()).tolist()
+        drawn[:] = self.alive
+        if len(changed) > len(self.trigons) // 8:
+            # outlines have to blend with the background, not with a dead cell below
+            dead_surface = None if Cell.antialiasing else self.get_dead_surface()
+            if dead_surface is None or dead_surface.get_size() != surface.get_size():
+                surface.fill(BACKGROUND_COLOR)
+                self.draw_cells(surface, range(len(self.trigons)))
+            else:
+                surface.blit(dead_surface, (0, 0))
+                self.draw_cells(surface, np.flatnonzero(self.alive.ravel()).tolist())
+            return
+        
+        if self.scratch is None or self.scratch.get_size() != surface.get_size():
+            self.scratch = pygame.Surface(surface.get_size())
+        for k in changed:
+            self.scratch.fill(BACKGROUND_COLOR, self.rects[k].unionall([self.rects[m] for m in self.overlapping[k]]))
+            self.draw_cells(self.scratch, self.overlapping[k])
+            surface.blit(self.scratch, self.rects[k], self.rects[k])
+    
+    def render(self):
+        self.draw(self.surface, self.surface_state)
+        return self.surface
                 
     
-    def get_cell_by_coord(self, pos: pygame.Vector2):
-        for col in self.cells:
-            for cell in col:
-                if cell.collidepoint(pos):
-                    return cell
+    def get_cell_by_coord(self, pos: Tuple[float, float]):
+        # invert the cell placement from __init__, only the few cells whose bounding box contains pos are tested
+        pitch_x = self.cell_width / 2 + self.cell_padding_left
+        pitch_y = self.cell_height + self.cell_padding_top
+        x = pos[0] - self.offset_x
+        y = pos[1] - self.offset_y
+        for i in range(max(math.ceil((x - self.cell_width / 2) / pitch_x), 0),
+                       min(math.floor((x + self.cell_width / 2) / pitch_x) + 1, self.cell_count_x)):
+            for j in range(max(math.ceil((y - self.cell_height / 2) / pitch_y), 0),
+                           min(math.floor((y + self.cell_height / 2) / pitch_y) + 1, self.cell_count_y)):
+                if self.cells[i][j].collidepoint(pos):
+                    return i, j
         return None
 
 def int_to_bool_list(num: int, length: int):
-    ret = [bool(int(x)) for x in list('{0:0b}'.format(num))]
-    return [False] * (length - len(ret)) + ret
+    # most significant bit first, numbers wider than length keep all their bits
+    length = max(length, num.bit_length())
+    bits = np.unpackbits(np.frombuffer(num.to_bytes((length + 7) // 8, 'big'), dtype=np.uint8))
+    return bits[len(bits) - length:].astype(bool).tolist()
 
 def bool_list_to_int(lst):
-    return int('0b' + ''.join(['1' if x else '0' for x in lst]), base=2)
+    # left pad to whole bytes, packbits pads on the right
+    bits = np.asarray(lst, dtype=bool)
+    bits = np.concatenate((np.zeros(-len(bits) % 8, dtype=bool), bits))
+    return int.from_bytes(np.packbits(bits).tobytes(), 'big')
         
 class WolframRule(Rule):
     def __init__(self, rule_num: int):
         self.rule_num = rule_num
     
-    def get_new_state(self, automaton: Automaton, cell: Cell) -> bool:
-        return int_to_bool_list(self.rule_num, 2**len(cell.neighbors))[-bool_list_to_int([automaton.cells[i][j].is_alive for i, j in cell.neighbors])]
+    def get_lut(self, neighborhood_size: int) -> Tuple[np.ndarray, np.ndarray]:
+        # new state for every neighbor pattern, pattern p picks rule bit -p (pattern 0 picks the highest one)
+        rule_bits = np.array(int_to_bool_list(self.rule_num, 2**neighborhood_size), dtype=np.uint8)
+        lut = rule_bits[-np.arange(2**neighborhood_size)]
+        # the first neighbor is the most significant bit of the pattern, the cell itself is ignored
+        weights = np.array([0] + [2**k for k in reversed(range(neighborhood_size))], dtype=np.int64)
+        return weights, lut
     
     def __str__(self) -> str:
         return str(self.rule_num)
 
 class LifelikeRule(Rule):
     def __init__(self, birth: set, survival: set) -> None:
-        self.birth = birth
-        self.survival = survival
+        # frozen copies, automatons build their luts from them and printing the rule must agree with those
+        self.birth = frozenset(birth)
+        self.survival = frozenset(survival)
     
-    def get_new_state(self, automaton: Automaton, cell: Cell) -> bool:
-        alive_count = 0
-        for i, j in cell.neighbors:
-            alive_count += automaton.cells[i][j].is_alive
-            
-        if not cell.is_alive and alive_count in self.birth or cell.is_alive and alive_count in self.survival:
-            return True
-        return False
+    def get_lut(self, neighborhood_size: int) -> Tuple[np.ndarray, np.ndarray]:
+        # indexed by own state * (neighborhood_size + 1) + alive neighbor count
+        lut = np.zeros(2 * (neighborhood_size + 1), dtype=np.uint8)
+        lut[[count for count in self.birth if count <= neighborhood_size]] = 1
+        lut[[neighborhood_size + 1 + count for count in self.survival if count <= neighborhood_size]] = 1
+        weights = np.array([neighborhood_size + 1] + [1] * neighborhood_size, dtype=np.int64)
+        return weights, lut
         
     def __str__(self):
-        return f"B{''.join(str(num) for num in self.birth)}/S{''.join(str(num) for num in self.survival)}"
+        return f"B{''.join(str(num) for num in sorted(self.birth))}/S{''.join(str(num) for num in sorted(self.survival))}"
 
 def step(automatons: List[Automaton], screen: pygame.Surface, population: list):
     pygame.image.save(screen, str(automatons[len(automatons) - 1].turn) + '.jpg')
     automatons.append(automatons[len(automatons) - 1].step())
-    population.append(automatons[len(automatons) - 1])
+    population.append(automatons[len(automatons) - 1].alive_count)
 
 
 
@@ -207,70 +358,93 @@ def main_loop(automaton: Automaton, screen: pygame.surface.Surface, sim_step_tim
             # font.render('H - show/hide this text', True, 'black')
             ]
     text_pos = (20, 20)
+    status_text = {
+            'paused': text[0],
+            'searching': font.render('Searching', True, 'black'),
+            'simulating': font.render('Simulating', True, 'black'),
+            }
+    shown_turn = 0
+    # the screen is only recomposed when something on it changed, an idle paused window costs next to nothing
+    redraw = True
     
     while running and not restarting:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
+            if event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                redraw = True
             if pygame.key.get_focused():
                 if event.type == pygame.KEYUP and event.key == pygame.K_SPACE:
                     paused = not paused 
+                    redraw = True
                 if event.type == pygame.KEYUP and event.key == pygame.K_RIGHT:
                     step(automatons=automatons, screen=screen, population=population)
+                    redraw = True
                 if event.type == pygame.MOUSEBUTTONUP:
-                    cell = automatons[len(automatons) - 1].get_cell_by_coord(pygame.Vector2(pygame.mouse.get_pos()))
-                    if cell:
-                        cell.is_alive = not cell.is_alive
+                    index = automatons[len(automatons) - 1].get_cell_by_coord(pygame.mouse.get_pos())
+                    if index:
+                        automatons[len(automatons) - 1].alive[index] ^= 1
+                        redraw = True
                 if event.type == pygame.KEYUP and event.key == pygame.K_r:
                     restarting = True
                 if event.type == pygame.KEYUP and event.key == pygame.K_h:
                     show_text = not show_text
+                    redraw = True
                 if event.type == pygame.KEYUP and event.key == pygame.K_f:
                     search_mode = not search_mode
+                    redraw = True
+                if event.type == pygame.KEYUP and event.key == pygame.K_a:
+                    Cell.antialiasing = not Cell.antialiasing
+                    automatons[len(automatons) - 1].surface_state.fill(2)
+                    redraw = True
                 if event.type == pygame.KEYUP and event.key == pygame.K_s:
                     pygame.image.save(screen, str(uuid.uuid4()) + '.jpg')
                 if event.type == pygame.KEYUP and event.key == pygame.K_LEFT:
                     if len(automatons) > 1:
                         automatons.pop()
+                        redraw = True
                 
         
         
         sim_step_timer -= dt / 1000
         if sim_step_timer <= 0 or search_mode:
             if not paused:
-                # if automatons[len(automatons) - 1].turn % 5 == 0:    
-                # old_cells = automatons[len(automatons) - 1].cells
                 step(automatons=automatons, screen=screen, population=population)
-                if search_mode and population[len(population) - 1] == 0:
+                redraw = True
+                if search_mode and (population[len(population) - 1] == 0 or automatons[len(automatons) - 1].stable):
                     restarting = True
                     
             sim_step_timer = sim_step_time
         
-        screen.fill((30, 30, 30))
-        automatons[len(automatons) - 1].draw(screen)
-        # automatons[len(automatons) - 1].cells[10][10].draw(screen)
-        # for i, j in automatons[len(automatons) - 1].cells[10][10].neighbors:
-        #     automatons[len(automatons) - 1].cells[i][j].draw(screen)
+        if redraw:
+            redraw = False
+            screen.fill(BACKGROUND_COLOR)
+            screen.blit(automatons[len(automatons) - 1].render(), (0, 0))
+            # automatons[len(automatons) - 1].cells[10][10].draw(screen, True)
+            # for i, j in (divmod(k, CELL_COUNT_Y) for k in automatons[len(automatons) - 1].neighbors[10 * CELL_COUNT_Y + 10]):
+            #     automatons[len(automatons) - 1].cells[i][j].draw(screen, True)
 
-        if show_text:
-            if paused:
-                text[0] = font.render("Paused", True, 'Black')
-            elif search_mode:
-                text[0] = font.render("Searching", True, 'Black')
-            else:
-                text[0] = font.render("Simulating", True, 'Black')
+            if show_text:
+                if paused:
+                    text[0] = status_text['paused']
+                elif search_mode:
+                    text[0] = status_text['searching']
+                else:
+                    text[0] = status_text['simulating']
 
-            text[1] = font.render(f't = {automatons[len(automatons) - 1].turn}', True, 'Black')
+                if automatons[len(automatons) - 1].turn != shown_turn:
+                    shown_turn = automatons[len(automatons) - 1].turn
+                    text[1] = font.render(f't = {shown_turn}', True, 'black')
             
-            pygame.gfxdraw.box(screen, 
-                                pygame.Rect(text_pos[0],
-                                            text_pos[1],
-                                            max(text, key=lambda line: line.get_width()).get_width(), text[0].get_height() * len(text)), 
-                                            (70, 70, 70, 200))
-            for i in range(len(text)):
-                screen.blit(text[i], (text_pos[0], text_pos[1] + i * text[0].get_height()))
+                pygame.gfxdraw.box(screen, 
+                                    pygame.Rect(text_pos[0],
+                                                text_pos[1],
+                                                max(text, key=lambda line: line.get_width()).get_width(), text[0].get_height() * len(text)), 
+                                                (70, 70, 70, 200))
+                for i in range(len(text)):
+                    screen.blit(text[i], (text_pos[0], text_pos[1] + i * text[0].get_height()))
         
-        pygame.display.flip()
+            pygame.display.flip()
 
         if search_mode:
             dt = clock.tick()
@@ -280,18 +454,20 @@ def main_loop(automaton: Automaton, screen: pygame.surface.Surface, sim_step_tim
     
     return population       
 
-def apply_init_state(automaton: Automaton, init_state: list):
-    for i in range(automaton.cell_count_x):
-        for j in range(automaton.cell_count_y):
-            automaton.cells[i][j].is_alive = init_state[i + j * automaton.cell_count_x]
+def apply_init_state(automaton: Automaton, init_state: list | np.ndarray):
+    # init_state is laid out row by row, i.e. cell (i, j) is init_state[i + j * cell_count_x]
+    automaton.alive[:] = np.asarray(init_state, dtype=np.uint8).reshape(automaton.cell_count_y, automaton.cell_count_x).T
 
-def gen_random_state(filling_range_halved: tuple, filling_center: tuple, whole_range: tuple, init_state: list | None = None):
+def gen_random_state(filling_range_halved: tuple, filling_center: tuple, whole_range: tuple, init_state: list | np.ndarray | None = None):
+    # same row by row layout as apply_init_state, so row j of the grid is state[j]
     if init_state is None:
-        init_state = [False] * (whole_range[0] * whole_range[1])
-    for i in range(filling_center[0] - filling_range_halved[0], filling_center[0] + filling_range_halved[0]):
-        for j in range(filling_center[1] - filling_range_halved[1], filling_center[1] + filling_range_halved[1]):
-            init_state[i + j * whole_range[0]] = bool(random.randint(0, 1))
-    return init_state
+        state = np.zeros((whole_range[1], whole_range[0]), dtype=np.uint8)
+    else:
+        state = np.asarray(init_state, dtype=np.uint8).reshape(whole_range[1], whole_range[0])
+    state[filling_center[1] - filling_range_halved[1]:filling_center[1] + filling_range_halved[1],
+          filling_center[0] - filling_range_halved[0]:filling_center[0] + filling_range_halved[0]] = \
+        np.random.default_rng().integers(0, 2, (2 * filling_range_halved[1], 2 * filling_range_halved[0]), dtype=np.uint8)
+    return state.ravel()
 
 running = True
 paused = True
@@ -332,9 +508,7 @@ def main():
         # rule = WolframRule(255)
         
         # rule = lifelike_ETA_notation(random.randint(0, 255), 3)
-        # rule.birth.add(0)
-        # if 3 in rule.survival:
-        #     rule.survival.remove(3)
+        # rule = LifelikeRule(birth=rule.birth | {0}, survival=rule.survival - {3})
         
         # init_state = gen_random_state(  filling_center=(int(CELL_COUNT_X / 2), int(CELL_COUNT_Y / 2)), 
         #                                 filling_range_halved=(3, 3),
@@ -366,13 +540,13 @@ def main():
         # automaton.step()
         # for i in range(int(CELL_COUNT_X / 2) - 6, int(CELL_COUNT_X / 2) + 7):
         #     for j in range(int(CELL_COUNT_Y / 2) - 3, int(CELL_COUNT_Y / 2) + 4):
-        #         if True not in automaton.gen_neighbors(automaton.cells[i][j]):
-        #             automaton.cells[i][j].is_alive = bool(random.randint(0, 1))
+        #         if True not in automaton.get_neighbor_states(i, j):
+        #             automaton.alive[i, j] = random.randint(0, 1)
 
         # for i in range(CELL_COUNT_X):
         #     for j in range(CELL_COUNT_Y):
         #         if automaton.cells[i][j].dir == CellDirection.DOWNWARDS:
-        #             automaton.cells[i][j].is_alive = not automaton.cells[i][j].is_alive
+        #             automaton.alive[i, j] ^= 1
 
         population = main_loop(automaton, screen, SIM_STEP_TIME)
         
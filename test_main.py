@@ -0,0 +1,50 @@
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import numpy as np
+import pygame
+import main
+
+
+def tiny_automaton():
+    # cells a few pixels wide without padding, so bounding rects reach several columns and rows away
+    width = 680
+    cell_count_x, cell_count_y = 400, 200
+    cell_width = 2 * width / cell_count_x
+    cell_height = width / cell_count_y
+    return main.Automaton(rule=main.LifelikeRule({0, 1}, {0, 2}),
+                          neighborhood=[(-1, 0), (0, 1), (1, 0)],
+                          cell_count_x=cell_count_x,
+                          cell_count_y=cell_count_y,
+                          cell_width=cell_width,
+                          cell_height=cell_height,
+                          offset_x=cell_width / 3,
+                          offset_y=cell_height / 2,
+                          cell_padding_left=0,
+                          cell_padding_top=0)
+
+
+def test_overlapping_matches_rects():
+    automaton = tiny_automaton()
+    for k in range(0, len(automaton.rects), 97):
+        assert automaton.overlapping[k] == automaton.rects[k].collidelistall(automaton.rects)
+
+
+def test_incremental_render_matches_full_draw():
+    rng = np.random.default_rng(0)
+    automaton = tiny_automaton()
+    for antialiasing in (False, True):
+        main.Cell.antialiasing = antialiasing
+        automaton.surface_state.fill(2)
+        automaton.alive[:] = rng.integers(0, 2, automaton.alive.shape)
+        automaton.render()
+        # few enough changes to stay on the incremental path
+        flat = automaton.alive.ravel()
+        flat[rng.choice(flat.size, flat.size // 50, replace=False)] ^= 1
+        automaton.render()
+
+        full = pygame.Surface(automaton.surface.get_size())
+        full.fill(main.BACKGROUND_COLOR)
+        automaton.draw(full)
+        assert pygame.image.tobytes(automaton.surface, 'RGB') == pygame.image.tobytes(full, 'RGB')
+    main.Cell.antialiasing = False